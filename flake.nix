@@ -12,8 +12,10 @@
 
       python = pkgs.python3.withPackages (ps: with ps; [
         jsonschema
-        jsonref
+        referencing
         json5
+        ijson
+        orjson
         rich
         setuptools
       ]);
@@ -0,0 +1,149 @@
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+import json5
+import orjson
+
+
+def loads_json5(raw: str):
+    """
+    Parse JSON/JSON5 text.
+
+    Most documents are strict JSON, so try orjson first and only fall back
+    to the (much slower, pure Python) json5 parser when that fails.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json5.loads(raw)
+
+def is_ref(obj) -> bool:
+    """True if obj is a JSON Reference object, i.e. ``{"$ref": "..."}``."""
+    return isinstance(obj, dict) and isinstance(obj.get("$ref"), str)
+
+class RefResolver:
+    """
+    Eagerly resolves $ref objects in parsed JSON documents, splicing the
+    referenced value in place of each reference.
+
+    Supports:
+        - Local JSON pointers: {"$ref": "#/styles/header"}
+        - Relative files, with an optional pointer: {"$ref": "other.jsonc#/styles/header"}
+        - Chained references (a reference whose target is itself a reference)
+
+    Remote references (any location with a URI scheme, e.g. "http://...")
+    are not fetched and raise ValueError.
+
+    Referenced values are shared, not copied, so each target is resolved
+    once and every later reference to it is a dict lookup.
+    """
+
+    def __init__(self):
+        self.documents = {}   # file -> parsed document
+        self.targets = {}     # (file, pointer) -> resolved target
+        self.pending = set()  # (file, pointer) currently being resolved
+        self.visited = set()  # id() of containers already walked
+
+    def load(self, file: Path):
+        """Load (once) a referenced JSON/JSON5 file."""
+        if file not in self.documents:
+            self.documents[file] = loads_json5(file.read_text(encoding="utf-8"))
+        return self.documents[file]
+
+    def resolve_ref(self, ref: str, file: Path):
+        """
+        Resolve a reference string relative to the file containing it.
+
+        Args:
+            ref (str): Value of the $ref key.
+            file (Path): Absolute path of the document containing the reference.
+
+        Returns:
+            The referenced value, with its own references resolved.
+        """
+        location, _, pointer = ref.partition("#")
+        if location:
+            if urlsplit(location).scheme:
+                raise ValueError(f"Remote $ref not supported: {ref}")
+            file = (file.parent / unquote(location)).resolve()
+
+        if pointer and not pointer.startswith("/"):
+            raise ValueError(f"Unresolvable $ref: {ref}")
+
+        key = (file, pointer)
+        if key in self.targets:
+            return self.targets[key]
+        if key in self.pending:
+            raise ValueError(f"Circular $ref: {ref}")
+
+        self.pending.add(key)
+        target = self.load(file)
+        try:
+            for part in pointer.split("/")[1:]:
+                target = self.deref(target, file)
+                part = unquote(part).replace("~1", "/").replace("~0", "~")
+                if isinstance(target, list):
+                    if not part.isdigit():
+                        raise KeyError(part)
+                    part = int(part)
+                target = target[part]
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f"Unresolvable $ref: {ref}") from None
+        target = self.deref(target, file)
+        self.pending.discard(key)
+
+        self.targets[key] = target
+        self.resolve_tree(target, file)
+        return target
+
+    def deref(self, obj, file: Path):
+        """Return obj, or its target if obj is a reference."""
+        return self.resolve_ref(obj["$ref"], file) if is_ref(obj) else obj
+
+    def resolve(self, data, file: Path):
+        """
+        Resolve a parsed value from file, in place.
+
+        Can be called repeatedly (e.g. once per streamed node); resolved
+        targets are shared between calls.
+        """
+        self.visited.clear()
+        data = self.deref(data, file)
+        self.resolve_tree(data, file)
+        return data
+
+    def resolve_tree(self, root, file: Path):
+        """Replace every reference below root in place (iterative DFS)."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, (dict, list)) or id(node) in self.visited:
+                continue
+            self.visited.add(id(node))
+
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in list(items):
+                if is_ref(value):
+                    value = node[key] = self.resolve_ref(value["$ref"], file)
+                stack.append(value)
+
+
+
+def resolve_refs(data, path: str, resolver=None):
+    """
+    Resolve all $ref objects in a document parsed from path, in place.
+
+    Args:
+        data: Parsed JSON document.
+        path (str): File the document was read from; relative file
+            references are resolved against it.
+        resolver (RefResolver): Resolver to use; afterwards its documents
+            hold every file that was loaded. A new one by default.
+
+    Returns:
+        The document with references replaced by their targets.
+    """
+    file = Path(path).resolve()
+    if resolver is None:
+        resolver = RefResolver()
+    resolver.documents[file] = data
+    return resolver.resolve(data, file)
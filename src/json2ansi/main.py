@@ -1,24 +1,46 @@
-import json
-import json5
+import functools
+import heapq
+import io
+import itertools
+import orjson
+import os
 import sys
 from pathlib import Path
-import jsonref
-from jsonschema import Draft7Validator, validators
-from rich.console import Console
+from jsonschema import ValidationError, validators
+from referencing import Registry
+from rich.align import Align
+from rich.console import Console, Group, NewLine
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from rich.padding import Padding
 from .markdown_to_rich import md_to_rich_text
+from .json_refs import RefResolver, loads_json5, resolve_refs
 
 
 
 MIN_COLUMN_WIDTH_FLEX = 3
 MIN_COLUMN_WIDTH_DYNAMIC = 1
 DEFAULT_CONTEXT_WIDTH = 80
+MAX_VALIDATION_ERRORS = 20
+MAX_CACHED_DOCUMENTS = 32
+
+# Column size modes, as used by compute_column_widths
+SIZE_FIXED = 0
+SIZE_FLEX = 1
+SIZE_MODES = {"fixed": SIZE_FIXED, "flex": SIZE_FLEX}
+
+# Style properties that affect rendering, in Rich style string order
+STYLE_PROPERTIES = ("fg", "bg", "bold", "italic", "underline", "link")
+
+# DSL align codes to Rich justify/align methods
+ALIGNMENTS = {"l": "left", "c": "center", "r": "right"}
+
+# DSL column overflow modes to Rich no_wrap flags
+NO_WRAP = {"wrap": False, "truncate": True}
 
 # Use absolute path to schema.json based on script location
 SCHEMA_FILE = Path(__file__).parent / "schema.json"
-SCHEMA = json.loads(SCHEMA_FILE.read_text())
 
 
 
@@ -45,178 +67,469 @@ def extend_with_default(validator_class):
     )
 
 
-def load_json5_with_refs(path: str):
+@functools.lru_cache(maxsize=1)
+def get_schema():
+    """Load schema.json on first use (keeps importing this module cheap)."""
+    return orjson.loads(SCHEMA_FILE.read_bytes())
+
+@functools.lru_cache(maxsize=16)
+def _validator_for_key(schema_key: bytes):
+    schema = orjson.loads(schema_key)
+    validator_class = extend_with_default(validators.validator_for(schema))
+    validator_class.check_schema(schema)
+    return validator_class(schema, registry=Registry())
+
+@functools.lru_cache(maxsize=1)
+def _default_validator():
+    return _validator_for_key(orjson.dumps(get_schema(), option=orjson.OPT_SORT_KEYS))
+
+def get_validator(schema=None):
+    """
+    Get the defaults-applying validator for a schema (default: schema.json).
+
+    Validators are cached by schema content (its sorted-key JSON), so each
+    distinct schema is checked against its metaschema and built once, however
+    many documents it validates; the default one is not even re-serialized.
+    The validator class follows the schema's "$schema" draft, and the empty
+    registry keeps $ref resolution local (no remote fetches).
+    """
+    if schema is None:
+        return _default_validator()
+    return _validator_for_key(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+
+@functools.lru_cache(maxsize=64)
+def _subschema_validator_for_key(subschema_key: bytes):
+    return get_validator().evolve(schema=orjson.loads(subschema_key))
+
+def subschema_validator(subschema):
+    """
+    Get a validator for a fragment of the schema, e.g. {"$ref": "#/$defs/scaffold"}.
+
+    Refs still resolve against the full schema. Validators are cached by
+    subschema content, so identical fragments share one instance; use this
+    for per-node validation rather than building validators in a loop.
+    """
+    return _subschema_validator_for_key(orjson.dumps(subschema, option=orjson.OPT_SORT_KEYS))
+
+
+def load_json5_with_refs(path: str, resolver=None):
     """
     Load a JSON/JSON5 file and expand $ref references.
 
-    Uses json5 to allow trailing commas and other JSON5 features,
-    then normalizes to strict JSON for jsonref.
+    Strict JSON takes a fast path; json5 is used as a fallback to allow
+    trailing commas and other JSON5 features. Refs are then resolved
+    directly on the parsed objects (using resolver, if given).
     """
     with open(path, "r", encoding="utf-8") as f:
-        data = json5.load(f)
+        data = loads_json5(f.read())
+
+    # expands $ref in place; relative file refs resolve against the file itself
+    return resolve_refs(data, path, resolver)
+
+def exit_on_errors(errors, path_prefix=()):
+    """Print validation errors (up to MAX_VALIDATION_ERRORS) and exit if there are any."""
+    errors = iter(errors)
+    first = next(errors, None)
+    if first is None:
+        # valid: nothing to collect
+        return
+
+    # Stop collecting after a screenful and sort what was collected by path.
+    # When there are more errors, these are the ones the validator found
+    # first, not necessarily the first ones in the document. Paths are
+    # compared as tuples, which is much cheaper than comparing deques.
+    errors = [first, *itertools.islice(errors, MAX_VALIDATION_ERRORS)]
+    errors.sort(key=lambda e: tuple(e.absolute_path))
+    for error in errors[:MAX_VALIDATION_ERRORS]:
+        print(f"Validation error at {[*path_prefix, *error.path]}: {error.message}")
+    if len(errors) > MAX_VALIDATION_ERRORS:
+        print(f"... more than {MAX_VALIDATION_ERRORS} validation errors, showing {MAX_VALIDATION_ERRORS} of them")
+    sys.exit(1)
+
+def load_and_validate(file_path: str, resolver=None):
+    """Load JSON, expand $ref, validate against schema, apply defaults, normalize tables."""
+    data = load_json5_with_refs(file_path, resolver)
+    exit_on_errors(get_validator().iter_errors(data))
+    normalize_tables(data["content"])
+    return data
 
-    json_str = json.dumps(data)
+# absolute path -> (((file, mtime_ns), ...) for the file and its $ref'd files, document)
+LOADED_DOCUMENTS = {}
 
-    # expands $ref
-    return jsonref.loads(json_str, jsonschema=True)
+def file_mtimes(files):
+    return tuple((file, os.stat(file).st_mtime_ns) for file in files)
 
-def load_and_validate(file_path: str):
-    """Load JSON, expand $ref, validate against schema, apply defaults."""
-    data = load_json5_with_refs(file_path)
+def load_document(file_path: str):
+    """
+    load_and_validate, reusing the parsed document while the file is unchanged.
 
-    DefaultValidatingDraft7Validator = extend_with_default(Draft7Validator)
-    validator = DefaultValidatingDraft7Validator(SCHEMA)
-    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-    if errors:
-        for error in errors:
-            print(f"Validation error at {list(error.path)}: {error.message}")
-        sys.exit(1)
+    A cached document is reused only while the file and every file it pulls
+    in through $ref keep their modification times, so repeated renders of
+    the same file (e.g. at different widths) skip parsing and validation.
+    The document is shared between callers, not copied. Tables render from
+    their "_norm" cells, so delete "_norm" after editing a table's rows.
+    """
+    path = os.path.abspath(file_path)
+    cached = LOADED_DOCUMENTS.pop(path, None)
+    if cached is not None:
+        mtimes, data = cached
+        try:
+            if file_mtimes(file for file, _ in mtimes) == mtimes:
+                LOADED_DOCUMENTS[path] = cached
+                return data
+        except OSError:
+            pass
+
+    # Stat the file before reading it, so an edit made while loading is
+    # picked up next time
+    mtime_ns = os.stat(path).st_mtime_ns
+    resolver = RefResolver()
+    data = load_and_validate(path, resolver)
+    # Oldest entries go first (dicts keep insertion order; hits are re-inserted)
+    while len(LOADED_DOCUMENTS) >= MAX_CACHED_DOCUMENTS:
+        del LOADED_DOCUMENTS[next(iter(LOADED_DOCUMENTS))]
+    refs = [file for file in resolver.documents if str(file) != path]
+    LOADED_DOCUMENTS[path] = (((path, mtime_ns), *file_mtimes(refs)), data)
     return data
 
+def top_level_types(events):
+    """
+    Map each top-level key of a streamed JSON object to the first ijson
+    event of its value ("start_array", "start_map", "string", ...), without
+    building any values. Returns None if the document is not an object.
+    """
+    events = iter(events)
+    if next(events, (None, None, None))[1] != "start_map":
+        return None
+
+    types = {}
+    key = None
+    for prefix, event, value in events:
+        if prefix == "" and event == "map_key":
+            key = value
+        elif key is not None and prefix == key:
+            types[key] = event
+            key = None
+    return types
+
+def stream_and_validate(file_path: str):
+    """
+    Stream the content nodes of a large document one at a time.
+
+    Uses ijson, so the input must be strict JSON (no JSON5 extensions).
+    A first pass checks the top-level structure (an object with "styles"
+    and a "content" array) without building anything. Then "styles" is read,
+    and each item of "content" is parsed, has its $ref expanded, is
+    validated against the scaffold schema (applying defaults) and is
+    yielded, so memory stays proportional to one node.
+    Refs may target "styles" or other files, but not other content nodes.
+    """
+    try:
+        import ijson
+    except ImportError:
+        sys.exit("--stream requires ijson (pip install 'json2ansi[stream]')")
+
+    file = Path(file_path).resolve()
+    resolver = RefResolver()
+
+    def resolve(data):
+        try:
+            return resolver.resolve(data, file)
+        except ValueError as e:
+            sys.exit(f"{file_path}: {e} (with --stream, $refs within the file can only target \"styles\")")
+
+    with open(file, "rb") as f:
+        try:
+            types = top_level_types(ijson.parse(f))
+            if types is None:
+                exit_on_errors([ValidationError("document is not of type 'object'")])
+
+            errors = []
+            for key in ("content", "styles"):
+                if key not in types:
+                    errors.append(ValidationError(f"'{key}' is a required property"))
+            if types.get("content", "start_array") != "start_array":
+                errors.append(ValidationError("content is not of type 'array'", path=["content"]))
+            exit_on_errors(errors)
+
+            f.seek(0)
+            styles = next(ijson.items(f, "styles", use_float=True))
+            resolver.documents[file] = {"styles": styles}
+            styles = resolve(styles)
+            exit_on_errors(subschema_validator(get_schema()["properties"]["styles"]).iter_errors(styles), ["styles"])
+
+            f.seek(0)
+            validator = subschema_validator(get_schema()["properties"]["content"]["items"])
+            for i, node in enumerate(ijson.items(f, "content.item", use_float=True)):
+                node = resolve(node)
+                exit_on_errors(validator.iter_errors(node), ["content", i])
+                normalize_tables([node])
+                yield node
+        except ijson.JSONError as e:
+            sys.exit(f"{file_path}: invalid JSON for --stream, which needs strict JSON (no JSON5): {e}")
+
 
 
 # -------------------------------------------
 #  RENDERING
 # -------------------------------------------
 
-def style_to_rich(style_obj):
-    """Convert style dict into Rich style string."""
-    fg = style_obj.get("fg") or None
-    bg = style_obj.get("bg") or None
-    parts = []
-    if fg: parts.append(f"{fg}")
-    if bg: parts.append(f"on {bg}")
-    if style_obj.get("bold"): parts.append("bold")
-    if style_obj.get("italic"): parts.append("italic")
-    if style_obj.get("underline"): parts.append("underline")
-    if style_obj.get("link"):
-        parts.append(f"link {style_obj['link']}")
-    return " ".join(parts)
-
-def combine_styles(styles):
+def freeze_style(style_obj):
     """
-    Combine a list of style dicts into one, with later dicts overriding earlier ones.
+    Hashable form of a style dict, used as a memoization key.
+
+    Only the properties that affect rendering are kept, so extra (unknown)
+    properties can't make the key unhashable.
     """
+    return tuple((k, style_obj[k]) for k in STYLE_PROPERTIES if k in style_obj)
+
+@functools.lru_cache(maxsize=1024)
+def _combine_styles_frozen(frozen_styles):
     result = {}
-    for style in styles:
-        result.update(style)
-    return result
-
-def render_text(node, column_width):
-    """Render styled text or command node to Rich Text (no overflow here)."""
-    match node:
-        case {"type": "text", "value": val, **rest}:
-            txt = md_to_rich_text(val)
-            styles = rest.get("styles", [])
-            if styles:
-                combined = combine_styles(styles)
-                txt.stylize(style_to_rich(combined))
-
-        case {"type": "repeat", "value": val, **rest}:
-            # Fill logic is done at table level via width
-            txt = Text(val * column_width)
-
-            styles = rest.get("styles", [])
-            if styles:
-                combined = combine_styles(styles)
-                txt.stylize(style_to_rich(combined))
-
-        case list() if all(seg.get("type") == "text" for seg in node):
-            # textArray: merge styled segments
-            txt = Text()
-            for seg in node:
-                seg_txt = render_text(seg, column_width)
-                txt.append(seg_txt)
-
-        case _:
-            raise ValueError(f"Unknown text type")
+    for style_items in frozen_styles:
+        result.update(style_items)
+    return freeze_style(result)
+
+@functools.lru_cache(maxsize=1024)
+def compile_style(key):
+    """
+    Build the Rich Style for a merged style key (see style_key), once per key.
+
+    Passing Style objects to Text.stylize skips Rich's style string parser.
+    """
+    g = dict(key).get
+    return Style(
+        color=g("fg") or None,
+        bgcolor=g("bg") or None,
+        bold=g("bold") or None,
+        italic=g("italic") or None,
+        underline=g("underline") or None,
+        link=g("link") or None,
+    )
+
+def style_key(styles):
+    """
+    Merged, hashable form of a list of style dicts, or None when unstyled.
+
+    Convert it to a Rich Style with compile_style.
+    """
+    if not styles:
+        return None
+    # A merged style without any rendering property is the same as no style
+    return _combine_styles_frozen(tuple(freeze_style(s) for s in styles)) or None
+
+def normalize_cell(cell):
+    """
+    Flatten a text or command node into a hashable ``(kind, segments,
+    length)`` triple, where segments is a tuple of ``(value, style_key)``
+    pairs and length is the raw length of the value(s).
+
+    Tables normalize their cells once, so width computation and rendering
+    don't both have to dispatch on the raw cell dicts, and styles are
+    merged once per cell rather than once per render.
+    """
+    if type(cell) is list:
+        # textArray: one segment per styled piece (the schema guarantees
+        # every segment is a primitive text node)
+        segments = tuple((seg["value"], style_key(seg.get("styles"))) for seg in cell)
+        return "text", segments, sum(len(val) for val, _ in segments)
+
+    cell_type = cell.get("type")
+    if cell_type == "text" or cell_type == "repeat":
+        val = cell["value"]
+        return cell_type, ((val, style_key(cell.get("styles"))),), len(val)
+
+    raise ValueError(f"Unknown text type: {cell}")
+
+
+def normalize_rows(rows):
+    return [[normalize_cell(cell) for cell in row] for row in rows]
 
+
+def normalize_tables(nodes):
+    """
+    Normalize the cells of every table among (and below) nodes, storing
+    them on the table as "_norm".
+
+    Run once right after validation, so renders (at any width) never look
+    at the raw cells again.
+    """
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if node["type"] == "indent":
+            stack.extend(node["content"])
+        elif node["type"] == "table" and "_norm" not in node:
+            node["_norm"] = normalize_rows(node["rows"])
+
+
+@functools.lru_cache(maxsize=1024)
+def repeat_text(val, column_width, key):
+    """
+    Fill a column with a repeated string (repeat command).
+
+    Fill logic is done at table level via width, so the same (value, width,
+    style) recurs across rows and tables; the result is shared, not copied,
+    since Rich never modifies cell renderables.
+    """
+    txt = Text(val * column_width)
+    if key:
+        txt.stylize(compile_style(key))
     return txt
 
 
-def calc_dynamic_width(rows, col_idx):
-    max_len = MIN_COLUMN_WIDTH_DYNAMIC
+def render_text(cell, column_width):
+    """Render a normalized cell to Rich Text (no overflow here)."""
+    kind, segments, _ = cell
+    if kind == "repeat":
+        (val, key), = segments
+        return repeat_text(val, column_width, key)
+
+    if len(segments) == 1:
+        val, key = segments[0]
+        if not key:
+            # Unstyled cells are never modified, so share the cached Text
+            return md_to_rich_text(val, copy=False)
+        txt = md_to_rich_text(val)
+        txt.stylize(compile_style(key))
+        return txt
+
+    # textArray: assemble the segments in one go. Unstyled segments and
+    # segments without any markdown pass no intermediate Text copy.
+    parts = []
+    for val, key in segments:
+        seg_txt = md_to_rich_text(val, copy=False)
+        if not key:
+            parts.append(seg_txt)
+        elif not seg_txt.spans:
+            parts.append((seg_txt.plain, compile_style(key)))
+        else:
+            seg_txt = seg_txt.copy()
+            seg_txt.stylize(compile_style(key))
+            parts.append(seg_txt)
+    return Text.assemble(*parts)
+
+
+class RenderedCells(dict):
+    """(normalized cell, column width) -> Text, rendering each key on first lookup."""
+
+    def __missing__(self, key):
+        txt = self[key] = render_text(*key)
+        return txt
+
+
+def calc_dynamic_widths(rows, col_indices):
+    """
+    Widest raw value of each of the given columns of normalized rows,
+    computed in a single pass over the rows.
+    """
+    widths = [MIN_COLUMN_WIDTH_DYNAMIC] * len(col_indices)
     for row in rows:
-        cell = row[col_idx]
-        match cell:
-            case {"type": "text", "value": val}:
-                max_len = max(max_len, len(str(val)))
-            case {"type": "repeat", "value": val}:
-                max_len = max(max_len, len(str(val)))
-            case list() if all(isinstance(seg, dict) and seg.get("type") == "text" for seg in cell):
-                val = "".join(seg["value"] for seg in cell)
-                max_len = max(max_len, len(val))
-            case _:
-                raise ValueError(f"Unknown cell type for dynamic width: {cell}")
-    return max_len
+        for j, i in enumerate(col_indices):
+            length = row[i][2]
+            if length > widths[j]:
+                widths[j] = length
+    return widths
 
 
 def closest_ratio_distribution(weights, total):
     if total == 0:
         return [0] * len(weights)
-    if sum(weights) == 0:
+    total_weight = sum(weights)
+    if total_weight == 0:
         raise ValueError("All weights are zero, cannot distribute")
 
-    total_weight = sum(weights)
-    exact_values = [w / total_weight * total for w in weights]
-    floor_values = [int(v) for v in exact_values]
-    
+    # floor each exact share, pairing its fractional part with its index
+    floor_values = []
+    remainders = []
+    for i, w in enumerate(weights):
+        v = w / total_weight * total
+        floor_v = int(v)
+        floor_values.append(floor_v)
+        remainders.append((v - floor_v, i))
+
     remainder = total - sum(floor_values)
-    # pair remainders with index
-    remainders = [(v - int(v), i) for i, v in enumerate(exact_values)]
     # assign remaining units to largest fractional parts
-    for _, i in sorted(remainders, reverse=True)[:remainder]:
-        floor_values[i] += 1
-    
+    if remainder > 0:
+        for _, i in heapq.nlargest(remainder, remainders):
+            floor_values[i] += 1
+
     return floor_values
 
 
-def compute_column_widths(columns, rows, context_width, indent):
-    """Compute column widths for a table given columns, rows, context width, and indent."""
+def column_size_specs(columns):
+    """Flatten column size specs into parallel (modes, values) lists."""
+    modes = []
+    values = []
+    for col in columns:
+        size = col["size"]
+        mode = SIZE_MODES.get(size["mode"])
+        if mode is None:
+            raise ValueError(f"Unknown or invalid size spec: {size}")
+        modes.append(mode)
+        values.append(size["value"])
+    return modes, values
+
+
+def compute_column_widths(modes, values, rows, context_width, indent):
+    """Compute column widths for a table given its flattened size specs, rows, context width, and indent."""
     effective_width = max(context_width - indent, MIN_COLUMN_WIDTH_FLEX)
-    num_cols = len(columns)
+    num_cols = len(modes)
     total_separators = num_cols - 1
 
     # Pass 1: Set fixed and dynamic widths, flex stays None
     col_widths = [None] * num_cols
     flex_indices = []
     flex_weights = []
-    for i, col in enumerate(columns):
-        size = col["size"]
-        match size:
-            case {"mode": "fixed", "value": v} if v > 0:
-                col_widths[i] = v  # No minimum for fixed
-            case {"mode": "fixed", "value": 0}:
-                col_widths[i] = calc_dynamic_width(rows, i)  # No minimum for dynamic
-            case {"mode": "flex", "value": w}:
-                flex_indices.append(i)
-                flex_weights.append(w)
-            case _:
-                raise ValueError(f"Unknown or invalid size spec: {size}")
+    dynamic_indices = []
+    fixed_sum = 0
+    for i in range(num_cols):
+        v = values[i]
+        if modes[i] == SIZE_FLEX:
+            flex_indices.append(i)
+            flex_weights.append(v)
+        elif v:
+            col_widths[i] = v  # No minimum for fixed
+            fixed_sum += v
+        else:
+            dynamic_indices.append(i)
+
+    # Dynamic widths for all such columns in one pass over the rows
+    if dynamic_indices:
+        for i, width in zip(dynamic_indices, calc_dynamic_widths(rows, dynamic_indices)):
+            col_widths[i] = width  # No minimum for dynamic
+            fixed_sum += width
 
     # Pass 2: Compute flex widths
-    used_width = sum(w for w in col_widths if w is not None) + total_separators
+    used_width = fixed_sum + total_separators
     remaining = effective_width - used_width
     if flex_indices:
         # Use closest_ratio_distribution to assign widths
         flex_widths = closest_ratio_distribution(flex_weights, remaining)
-        for idx, i in enumerate(flex_indices):
-            col_widths[i] = max(flex_widths[idx], MIN_COLUMN_WIDTH_FLEX)
+        for i, width in zip(flex_indices, flex_widths):
+            width = max(width, MIN_COLUMN_WIDTH_FLEX)
+            col_widths[i] = width
+            used_width += width
 
     # Error if table cannot fit
-    used_width = sum(col_widths) + total_separators
     if used_width > effective_width:
         raise ValueError(f"Table width {used_width} exceeds context width {effective_width}")
     
     return col_widths
 
 
-def render_table(node, console, indent=0, context_width=DEFAULT_CONTEXT_WIDTH):
-    """Render a table node to a Rich Table, aware of context width and column sizing."""
+def render_table(node, indent=0, context_width=DEFAULT_CONTEXT_WIDTH):
+    """Build the Rich renderable for a table node, aware of context width and column sizing."""
     columns = node["columns"]
-    rows = node["rows"]
-    col_widths = compute_column_widths(columns, rows, context_width, indent)
-
+    # Loaded documents are normalized up front; this covers tables built elsewhere
+    if "_norm" not in node:
+        node["_norm"] = normalize_rows(node["rows"])
+    rows = node["_norm"]
+    for i, row in enumerate(rows):
+        if len(row) > len(columns):
+            raise ValueError(f"Table row {i} has {len(row)} cells but only {len(columns)} columns")
+    modes, values = column_size_specs(columns)
+    col_widths = compute_column_widths(modes, values, rows, context_width, indent)
 
     table = Table(
         padding=(0, 1, 0, 0),
@@ -232,8 +545,8 @@ def render_table(node, console, indent=0, context_width=DEFAULT_CONTEXT_WIDTH):
 
     # Configure columns
     for i, col in enumerate(columns):
-        justify = {"l": "left", "c": "center", "r": "right"}[col["align"]]
-        no_wrap = col["overflow"] == "truncate"
+        justify = ALIGNMENTS[col["align"]]
+        no_wrap = NO_WRAP[col["overflow"]]
 
         table.add_column(
             justify=justify,
@@ -242,35 +555,45 @@ def render_table(node, console, indent=0, context_width=DEFAULT_CONTEXT_WIDTH):
             overflow="ellipsis",
         )
 
-    # Add rows
+    # Add rows. Identical cells (same values, styles and column width) share
+    # one Text, which is safe since Rich never modifies cell renderables.
+    rendered = RenderedCells()
     for row in rows:
-        cells = []
-        for col_index, cell in enumerate(row):
-            cells.append(render_text(cell, col_widths[col_index]))
-        table.add_row(*cells)
+        table.add_row(*[rendered[key] for key in zip(row, col_widths)])
 
-    console.print(
+    return Align(
         Padding(table, (0, 0, 0, indent)),
-        justify={"l": "left", "c": "center", "r": "right"}[node["properties"]["align"]],
-        width=context_width
+        ALIGNMENTS[node["properties"]["align"]],
     )
 
 
-def render_scaffold(node, console, indent=0, context_width=None):
-    if node["type"] == "indent":
-        child_indent = indent + node["indent"]
-        for child in node["content"]:
-            render_scaffold(child, console, indent=child_indent, context_width=context_width)
+def render_scaffold(nodes, indent=0, context_width=None):
+    """Yield the Rich renderables for a list of sibling scaffold nodes, in document order."""
+    # Explicit stack of (node, indent) instead of recursing into indents
+    stack = [(node, indent) for node in reversed(nodes)]
+    while stack:
+        node, indent = stack.pop()
+        node_type = node["type"]
+
+        if node_type == "indent":
+            child_indent = indent + node["indent"]
+            stack.extend((child, child_indent) for child in reversed(node["content"]))
 
-    elif node["type"] == "table":
-        render_table(node, console, indent=indent, context_width=context_width)
+        elif node_type == "table":
+            yield render_table(node, indent=indent, context_width=context_width)
 
-    elif node["type"] == "br":
-        console.print()
+        elif node_type == "br":
+            yield NewLine()
 
 def render_document(doc, console, context_width=None):
-    for node in doc["content"]:
-        render_scaffold(node, console, indent=0, context_width=context_width)
+    """Render the whole document and emit it with a single console.print."""
+    renderables = render_scaffold(doc["content"], indent=0, context_width=context_width)
+    console.print(Group(*renderables), width=context_width)
+
+def render_stream(nodes, console, context_width=None):
+    """Render top-level scaffold nodes as they arrive, one console.print each."""
+    for node in nodes:
+        console.print(Group(*render_scaffold([node], indent=0, context_width=context_width)), width=context_width)
 
 
 
@@ -278,6 +601,44 @@ def render_document(doc, console, context_width=None):
 #  main
 # -------------------------------------------
 
+def render_file(json_file, width=DEFAULT_CONTEXT_WIDTH, file=None, stream=False):
+    """
+    Render a JSON document to ANSI.
+
+    Args:
+        json_file (str): Path to the JSON/JSON5 document.
+        width (int): Context width.
+        file: Text file to write ANSI output to, instead of stdout.
+        stream (bool): Render content nodes as they are parsed (see stream_and_validate).
+    """
+    # Non-streamed file output is rendered into memory and written with a
+    # single write() at the end
+    buffer = io.StringIO() if file is not None and not stream else None
+
+    if file is not None:
+        # Force ANSI for file output, with at least 256 colors even when we
+        # are in a dumb terminal like that of github actions
+        truecolor = os.environ.get("COLORTERM", "").strip().lower() in ("truecolor", "24bit")
+        console = Console(
+            file=buffer if buffer is not None else file,
+            force_terminal=True,
+            force_interactive=False,
+            color_system="truecolor" if truecolor else "256",
+            width=width,
+        )
+    else:
+        console = Console(force_terminal=True)
+
+    if stream:
+        render_stream(stream_and_validate(json_file), console, context_width=width)
+    else:
+        doc = load_document(json_file)
+        render_document(doc, console, context_width=width)
+
+    if buffer is not None:
+        file.write(buffer.getvalue())
+
+
 def main():  
     import argparse
     from contextlib import nullcontext
@@ -286,29 +647,13 @@ def main():
     parser.add_argument("json_file", help="Path to JSON file")
     parser.add_argument("--width", type=int, default=DEFAULT_CONTEXT_WIDTH, help="Global context width")
     parser.add_argument("--output", type=str, default=None, help="Write ANSI output to file instead of stdout")
+    parser.add_argument("--stream", action="store_true", help="Render content nodes as they are parsed (strict JSON only, needs ijson)")
     args = parser.parse_args()
 
 
     with (open(args.output, "w", encoding="utf-8") if args.output else nullcontext()) as f:
-        if args.output:
-            # in case we are in a dumb terminal like that of github actions
-            import os
-            os.environ["TERM"] = "xterm-256color"
-
-            # Force ANSI and truecolor for file output
-            console = Console(
-                file=f,
-                force_terminal=True,
-                force_interactive=False,
-                width=args.width,
-            )
-        else:
-            console = Console(force_terminal=True)
-        
-        doc = load_and_validate(args.json_file)
-        render_document(doc, console, context_width=args.width)
+        render_file(args.json_file, width=args.width, file=f, stream=args.stream)
 
 
 if __name__ == "__main__":
     main()
-
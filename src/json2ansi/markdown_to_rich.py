@@ -1,9 +1,10 @@
+import functools
 import re
 from typing import List, Optional
 from dataclasses import dataclass
 from rich.text import Text
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Represents a piece of text with an optional Rich style."""
     text: str
@@ -23,15 +24,26 @@ class MarkdownParser:
         - Nested italic inside bold
     """
 
-    # Patterns in order of precedence
-    PATTERNS = [
-        (re.compile(r'\*\*\*(.+?)\*\*\*'), 'bold italic'),  # ***bold+italic***
-        (re.compile(r'\*\*(.+?)\*\*'), 'bold'),            # **bold**
-        (re.compile(r'\*(.+?)\*'), 'italic'),              # *italic*
-        (re.compile(r'~~(.+?)~~'), 'strike'),              # ~~strike~~
-        (re.compile(r'__(.+?)__'), 'underline'),           # __underline__
-        (re.compile(r'\[(.+?)\]\((.+?)\)'), 'link'),       # [text](url)
-    ]
+    # Patterns in order of precedence, combined into a single alternation so
+    # that one left-to-right scan finds the earliest (and, on ties, highest
+    # precedence) marker. Each outer group is followed by its inner text group.
+    PATTERN = re.compile(
+        r'(?P<bold_italic>\*\*\*(.+?)\*\*\*)'     # ***bold+italic***
+        r'|(?P<bold>\*\*(.+?)\*\*)'               # **bold**
+        r'|(?P<italic>\*(.+?)\*)'                 # *italic*
+        r'|(?P<strike>~~(.+?)~~)'                 # ~~strike~~
+        r'|(?P<underline>__(.+?)__)'              # __underline__
+        r'|(?P<link>\[(.+?)\]\((.+?)\))'          # [text](url)
+    )
+
+    STYLES = {
+        'bold_italic': 'bold italic',
+        'bold': 'bold',
+        'italic': 'italic',
+        'strike': 'strike',
+        'underline': 'underline',
+        'link': 'link',
+    }
 
     def parse_inline(self, md: str) -> List[Token]:
         """
@@ -46,38 +58,31 @@ class MarkdownParser:
         if not md:
             return []
 
-        # Find first match among all patterns
-        first_match = None
-        first_style = None
-        for pattern, style in self.PATTERNS:
-            match = pattern.search(md)
-            if match and (first_match is None or match.start() < first_match.start()):
-                first_match = match
-                first_style = style
-
-        if not first_match:
-            return [Token(md)]
-
         tokens: List[Token] = []
-        start, end = first_match.span()
-        if start > 0:
-            tokens.extend(self.parse_inline(md[:start]))
-
-        inner_text = first_match.group(1)
-
-        # Handle special cases
-        if first_style == 'bold':
-            tokens.extend(self.handle_bold(inner_text))
-        elif first_style == 'link':
-            tokens.extend(self.handle_link(inner_text, first_match.group(2)))
-        else:
-            inner_tokens = self.parse_inline(inner_text)
-            for t in inner_tokens:
-                t.style = first_style if t.style is None else f'{t.style} {first_style}'
-            tokens.extend(inner_tokens)
-
-        if end < len(md):
-            tokens.extend(self.parse_inline(md[end:]))
+        pos = 0
+        for match in self.PATTERN.finditer(md):
+            start, end = match.span()
+            if start > pos:
+                tokens.append(Token(md[pos:start]))
+
+            style = self.STYLES[match.lastgroup]
+            inner_text = match.group(match.lastindex + 1)
+
+            # Handle special cases
+            if style == 'bold':
+                tokens.extend(self.handle_bold(inner_text))
+            elif style == 'link':
+                tokens.extend(self.handle_link(inner_text, match.group(match.lastindex + 2)))
+            else:
+                inner_tokens = self.parse_inline(inner_text)
+                for t in inner_tokens:
+                    t.style = style if t.style is None else f'{t.style} {style}'
+                tokens.extend(inner_tokens)
+
+            pos = end
+
+        if pos < len(md):
+            tokens.append(Token(md[pos:]))
 
         return tokens
 
@@ -138,17 +143,25 @@ class MarkdownParser:
 
 parser = MarkdownParser()
 
-def md_to_rich_text(md_text: str) -> Text:
+@functools.lru_cache(maxsize=4096)
+def _md_to_rich_text_cached(md_text: str) -> Text:
+    tokens = parser.parse_inline(md_text)
+    return parser.tokens_to_rich(tokens)
+
+def md_to_rich_text(md_text: str, copy: bool = True) -> Text:
     """
     Convert a Markdown string to a Rich Text object.
 
+    Parsed results are cached per string. By default callers get a copy,
+    since Rich Text is mutable (e.g. stylized afterwards).
+
     Args:
         md_text (str): Markdown string.
+        copy (bool): Set to False to get the shared cached Text, when the
+            result is only rendered and never modified.
 
     Returns:
         Text: Rich Text object.
     """
-    tokens = parser.parse_inline(md_text)
-    return parser.tokens_to_rich(tokens)
-
-
+    txt = _md_to_rich_text_cached(md_text)
+    return txt.copy() if copy else txt
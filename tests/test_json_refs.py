@@ -0,0 +1,60 @@
+import pytest
+
+from json2ansi.json_refs import resolve_refs
+
+
+def resolve(tmp_path, data, **files):
+    for name, text in files.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    return resolve_refs(data, str(tmp_path / "main.json"))
+
+
+def test_local_pointer(tmp_path):
+    data = {"styles": {"a": {"bold": True}}, "x": {"$ref": "#/styles/a"}}
+    assert resolve(tmp_path, data)["x"] == {"bold": True}
+
+
+def test_chained_refs(tmp_path):
+    data = {
+        "a": {"$ref": "#/b"},
+        "b": {"$ref": "#/c"},
+        "c": [1, 2],
+        "d": {"$ref": "#/b/1"},
+    }
+    result = resolve(tmp_path, data)
+    assert result["a"] == [1, 2]
+    assert result["d"] == 2
+
+
+def test_pointer_escapes(tmp_path):
+    data = {"m": {"a/b": 1, "c~d": 2}, "x": {"$ref": "#/m/a~1b"}, "y": {"$ref": "#/m/c~0d"}}
+    result = resolve(tmp_path, data)
+    assert result["x"] == 1
+    assert result["y"] == 2
+
+
+def test_file_ref(tmp_path):
+    data = {"x": {"$ref": "other.jsonc#/s"}}
+    result = resolve(tmp_path, data, **{"other.jsonc": "{ s: { y: { $ref: '#/t' } }, t: 3, }"})
+    assert result["x"] == {"y": 3}
+
+
+def test_circular_ref(tmp_path):
+    data = {"a": {"$ref": "#/b"}, "b": {"$ref": "#/a"}}
+    with pytest.raises(ValueError, match="Circular"):
+        resolve(tmp_path, data)
+
+
+@pytest.mark.parametrize("ref", [
+    "#/missing", "#/list/5", "#/list/x", "#/n/deeper", "#header", "#styles/header",
+])
+def test_unresolvable_ref(tmp_path, ref):
+    data = {"styles": {"header": {}}, "list": [0], "n": 1, "x": {"$ref": ref}}
+    with pytest.raises(ValueError, match="Unresolvable"):
+        resolve(tmp_path, data)
+
+
+def test_remote_ref(tmp_path):
+    data = {"x": {"$ref": "http://example.com/s.json#/x"}}
+    with pytest.raises(ValueError, match="Remote"):
+        resolve(tmp_path, data)
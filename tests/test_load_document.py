@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from json2ansi import main
+
+
+DOCUMENT = '{"styles": {"$ref": "styles.json"}, "content": [{"type": "br"}]}'
+STYLES = '{"s": {"type": "style", "bold": true}}'
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(main, "LOADED_DOCUMENTS", {})
+
+
+@pytest.fixture
+def doc(tmp_path):
+    (tmp_path / "styles.json").write_text(STYLES, encoding="utf-8")
+    path = tmp_path / "doc.json"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    return path
+
+
+def touch(path, text):
+    """Rewrite path with a modification time that is sure to differ."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+def test_cache_hit(doc):
+    assert main.load_document(str(doc)) is main.load_document(str(doc))
+
+
+def test_main_file_edit_reloads(doc):
+    first = main.load_document(str(doc))
+    touch(doc, DOCUMENT.replace('"br"', '"br"}, {"type": "br"'))
+    second = main.load_document(str(doc))
+    assert second is not first
+    assert len(second["content"]) == 2
+
+
+def test_ref_file_edit_reloads(doc):
+    first = main.load_document(str(doc))
+    touch(doc.parent / "styles.json", STYLES.replace("bold", "italic"))
+    second = main.load_document(str(doc))
+    assert second is not first
+    assert second["styles"]["s"]["italic"] is True
+
+
+def test_deleted_ref_file_reloads(doc):
+    main.load_document(str(doc))
+    (doc.parent / "styles.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        main.load_document(str(doc))
+
+
+def test_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "MAX_CACHED_DOCUMENTS", 2)
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.json"
+        path.write_text('{"styles": {}, "content": []}', encoding="utf-8")
+        paths.append(str(path))
+
+    a, b, c = paths
+    first_a = main.load_document(a)
+    main.load_document(b)
+    main.load_document(a)  # a hit makes a the most recently used
+    main.load_document(c)
+    assert list(main.LOADED_DOCUMENTS) == [a, c]
+    assert main.load_document(a) is first_a
@@ -0,0 +1,38 @@
+import pytest
+
+from json2ansi.main import stream_and_validate
+
+pytest.importorskip("ijson")
+
+
+def stream(tmp_path, text):
+    path = tmp_path / "doc.json"
+    path.write_text(text, encoding="utf-8")
+    return list(stream_and_validate(str(path)))
+
+
+def test_valid_stream(tmp_path):
+    nodes = stream(tmp_path, '{"styles": {}, "content": [{"type": "br"}, {"type": "br"}]}')
+    assert nodes == [{"type": "br"}, {"type": "br"}]
+
+
+@pytest.mark.parametrize("text, message", [
+    ('{"styles": {}}', "'content' is a required property"),
+    ('{"styles": {}, "content": {}}', "content is not of type 'array'"),
+    ('[1, 2]', "document is not of type 'object'"),
+])
+def test_invalid_structure(tmp_path, capsys, text, message):
+    with pytest.raises(SystemExit):
+        stream(tmp_path, text)
+    assert message in capsys.readouterr().out
+
+
+def test_json5_rejected(tmp_path):
+    with pytest.raises(SystemExit, match="strict JSON"):
+        stream(tmp_path, '{"styles": {}, "content": [{"type": "br"},]}')
+
+
+def test_ref_outside_styles(tmp_path):
+    text = '{"styles": {}, "defs": {"t": {"type": "br"}}, "content": [{"$ref": "#/defs/t"}]}'
+    with pytest.raises(SystemExit, match="--stream"):
+        stream(tmp_path, text)